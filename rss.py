@@ -10,10 +10,11 @@ Layout:
 
 TTS:
 - Zero-pip-deps on Windows: uses PowerShell + System.Speech.Synthesis (built-in)
+- If pywin32 happens to be installed, speaks in-process via SAPI instead
 - Keys:
     S  speak selected (title + summary)
     H  speak newest headline
-    X  stop speaking (kills PowerShell process)
+    X  stop speaking (cancels current + queued speech)
 
 Auto-speak:
 - Speaks ONLY when the newest headline changes (latch by item_id)
@@ -34,23 +35,37 @@ Author: Matt / VE7LTX
 from __future__ import annotations
 
 import base64
+import functools
+import gzip
+import heapq
+import http.client
 import json
+import operator
 import pathlib
 import queue
+import re
+import ssl
+import sys
 import threading
 import time
+import urllib.error
+import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
 import webbrowser
 import subprocess
-from dataclasses import dataclass
+import zlib
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from html import unescape as html_unescape
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import tkinter as tk
 from tkinter import font as tkfont
+from tkinter import ttk
 
 
 # =============================================================================
@@ -60,17 +75,24 @@ from tkinter import font as tkfont
 APP_TITLE = "RSSDOS — World Feed"
 CACHE_FILE = pathlib.Path("rssdos_cache.json")
 SEEN_FILE = pathlib.Path("rssdos_seen.json")
+ETAG_FILE = pathlib.Path("rssdos_etags.json")    # per-URL validators + last parsed body
 
 CACHE_TTL_SECONDS = 15 * 60
 HTTP_TIMEOUT_SECONDS = 15
+HTTP_MAX_REDIRECTS = 5
+HTTP_POOL_MAX_IDLE_PER_HOST = 4            # parked keep-alive sockets per host
+HTTP_MAX_PER_HOST = 2                      # concurrent requests to one origin
+FETCH_WORKERS = 12                         # feed fetch threads (shared, reused per refresh)
 
 MAX_ITEMS_TOTAL = 700
 MAX_ITEMS_PER_FEED = 140
+XML_FEED_CHUNK = 64 * 1024                 # parser is fed this many bytes at a time
 
 TITLE_CHARS_LIST = 120
 SUMMARY_CHARS_DETAIL = 1400
 HEADLINE_TITLE_CHARS = 70
 HEADLINE_COUNT = 10
+SEARCH_DEBOUNCE_MS = 80                    # filter box: rebuild once typing pauses
 
 # ---- Auto refresh + auto speak (newest headline latch) ----
 AUTO_REFRESH_SECONDS = 180                 # periodic live refresh
@@ -185,7 +207,7 @@ FEEDS: List[Dict[str, Any]] = [
 # MODELS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     id: str
     epoch: float
@@ -198,9 +220,12 @@ class Item:
     url: str
     domain: str
     is_new: bool
+    # GUI-side derived data, filled at ingest; not part of __init__ or the cache
+    _search_blob: str = field(default="", init=False, repr=False, compare=False)
+    _list_line: str = field(default="", init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedStatus:
     name: str
     cat: str
@@ -210,23 +235,33 @@ class FeedStatus:
     count: int
 
 
+# Cache rows are plain tuples in dataclass (init) field order; the field
+# names are stored alongside so a changed model invalidates the cache
+# instead of mis-assigning columns.
+ITEM_FIELDS = tuple(f.name for f in fields(Item) if f.init)
+STATUS_FIELDS = tuple(f.name for f in fields(FeedStatus) if f.init)
+_item_row = operator.attrgetter(*ITEM_FIELDS)
+_status_row = operator.attrgetter(*STATUS_FIELDS)
+
+
 # =============================================================================
 # UTIL
 # =============================================================================
 
-def _strip_html(text: str) -> str:
-    out = []
-    in_tag = False
-    for ch in text or "":
-        if ch == "<":
-            in_tag = True
-        elif ch == ">":
-            in_tag = False
-        elif not in_tag:
-            out.append(ch)
-    return "".join(out).replace("\u00a0", " ").strip()
+# "<...>" (an unclosed "<" runs to the end) plus any stray ">"
+_TAG_RE = re.compile(r"<[^>]*>?|>")
+_WS_RE = re.compile(r"\s+")    # str patterns: \s covers NBSP and friends
+
+
+def _clean(text: str, n: int) -> str:
+    """Feed text -> display text: strip tags, unescape, collapse whitespace, truncate to n."""
+    s = _WS_RE.sub(" ", html_unescape(_TAG_RE.sub("", text or ""))).strip()
+    if len(s) <= n:
+        return s
+    return s[: max(0, n - 1)].rstrip() + "…"
 
 
+@functools.lru_cache(maxsize=4096)     # the same titles come back on every refresh
 def _truncate(s: str, n: int) -> str:
     s = (s or "").strip()
     if len(s) <= n:
@@ -234,6 +269,7 @@ def _truncate(s: str, n: int) -> str:
     return s[: max(0, n - 1)].rstrip() + "…"
 
 
+@functools.lru_cache(maxsize=8192)     # pure, and most items share a handful of hosts
 def _domain_from_url(url: str) -> str:
     url = (url or "").strip()
     if not url:
@@ -270,77 +306,114 @@ def _parse_date_any(s: str) -> float:
         return 0.0
 
 
+@functools.lru_cache(maxsize=4096)
+def _fmt_minute(minute: int) -> str:
+    try:
+        return time.strftime("%H:%M", time.localtime(minute * 60))
+    except Exception:
+        return "--:--"
+
+
 def _fmt_hhmm(epoch: float) -> str:
+    # HH:MM only changes per minute, so memoize on the minute bucket
     if not epoch:
         return "--:--"
     try:
-        return time.strftime("%H:%M", time.localtime(epoch))
+        return _fmt_minute(int(epoch // 60))
     except Exception:
         return "--:--"
 
 
-def http_get(url: str) -> bytes:
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": USER_AGENT,
-            "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
-            "Cache-Control": "no-cache",
-        },
-        method="GET",
-    )
-    with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as r:
-        return r.read()
+def _rss_item(it: ET.Element) -> Dict[str, str]:
+    title = it.findtext("title") or ""
+    link = it.findtext("link") or ""
+    desc = it.findtext("description") or it.findtext("summary") or ""
+    pub = it.findtext("pubDate") or ""
+    return {"title": title, "url": link, "summary": desc, "date": pub}
 
 
-def parse_feed_best_effort(raw: bytes) -> List[Dict[str, str]]:
-    """
-    Return list of {title, url, summary, date_str} from RSS or Atom.
-    """
-    root = ET.fromstring(raw)
-
-    # RSS
-    channel = root.find("channel")
-    if channel is not None:
-        out: List[Dict[str, str]] = []
-        for it in channel.findall("item")[:MAX_ITEMS_PER_FEED]:
-            title = it.findtext("title") or ""
-            link = it.findtext("link") or ""
-            desc = it.findtext("description") or it.findtext("summary") or ""
-            pub = it.findtext("pubDate") or ""
-            out.append({"title": title, "url": link, "summary": desc, "date": pub})
-        return out
-
-    # Atom
-    entries = [e for e in root.iter() if e.tag.lower().endswith("entry")]
-    out2: List[Dict[str, str]] = []
-    for e in entries[:MAX_ITEMS_PER_FEED]:
-        title_el = next((c for c in e if c.tag.lower().endswith("title")), None)
-        title = title_el.text if title_el is not None and title_el.text else ""
-
-        updated_el = next((c for c in e if c.tag.lower().endswith("updated")), None)
-        published_el = next((c for c in e if c.tag.lower().endswith("published")), None)
-        date_str = (updated_el.text if updated_el is not None and updated_el.text else "") or (
-            published_el.text if published_el is not None and published_el.text else ""
-        )
+_ATOM_TEXT_FIELDS = ("title", "updated", "published", "summary", "content")
 
-        summary_el = next((c for c in e if c.tag.lower().endswith("summary")), None)
-        content_el = next((c for c in e if c.tag.lower().endswith("content")), None)
-        summary = (summary_el.text if summary_el is not None and summary_el.text else "") or (
-            content_el.text if content_el is not None and content_el.text else ""
-        )
 
-        link = ""
-        for c in e:
-            if c.tag.lower().endswith("link"):
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2].lower()
+
+
+def _atom_entry(e: ET.Element) -> Dict[str, str]:
+    # one pass over the children; first occurrence of each field wins
+    fields: Dict[str, str] = {}
+    link = ""
+    for c in e:
+        name = _local_name(c.tag)
+        if name == "link":
+            if not link:
                 href = c.attrib.get("href", "").strip()
                 rel = c.attrib.get("rel", "").strip().lower()
                 if href and (not rel or rel == "alternate"):
                     link = href
-                    break
+        elif name in _ATOM_TEXT_FIELDS and name not in fields:
+            fields[name] = c.text or ""
+
+    title = fields.get("title", "")
+    date_str = fields.get("updated", "") or fields.get("published", "")
+    summary = fields.get("summary", "") or fields.get("content", "")
+    return {"title": title, "url": link, "summary": summary, "date": date_str}
+
+
+def _xml_events(raw: bytes) -> Iterator[Tuple[str, ET.Element]]:
+    """
+    Push `raw` through an XMLPullParser in XML_FEED_CHUNK slices (zero-copy
+    memoryview) and yield its start/end events. Stop iterating and the rest
+    of the document is never fed to the parser.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    view = memoryview(raw)
+    for off in range(0, len(view), XML_FEED_CHUNK):
+        parser.feed(view[off:off + XML_FEED_CHUNK])
+        yield from parser.read_events()
+    parser.close()   # raises ParseError on empty / truncated input, like fromstring
+    yield from parser.read_events()
+
+
+def parse_feed_best_effort(raw: bytes) -> List[Dict[str, str]]:
+    """
+    Return list of {title, url, summary, date_str} from RSS or Atom.
+
+    Streams instead of building the whole tree: each item is read on its
+    end tag, then cleared and detached from its parent, and parsing stops
+    once MAX_ITEMS_PER_FEED items are collected.
+    """
+    out: List[Dict[str, str]] = []
+    stack: List[ET.Element] = []
+    is_rss = False
+
+    for event, el in _xml_events(raw):
+        if event == "start":
+            # RSS: <channel> directly under the root (same rule as root.find("channel"))
+            if len(stack) == 1 and el.tag == "channel":
+                is_rss = True
+            stack.append(el)
+            continue
+
+        stack.pop()
+        parent = stack[-1] if stack else None
+
+        if is_rss:
+            if el.tag != "item" or parent is None or parent.tag != "channel":
+                continue
+            out.append(_rss_item(el))
+        else:
+            if _local_name(el.tag) != "entry":
+                continue
+            out.append(_atom_entry(el))
 
-        out2.append({"title": title, "url": link, "summary": summary, "date": date_str})
-    return out2
+        el.clear()
+        if parent is not None:
+            parent.remove(el)
+        if len(out) >= MAX_ITEMS_PER_FEED:
+            break
+
+    return out
 
 
 def load_seen() -> set[str]:
@@ -348,7 +421,7 @@ def load_seen() -> set[str]:
         if SEEN_FILE.exists():
             data = json.loads(SEEN_FILE.read_text(encoding="utf-8"))
             if isinstance(data, list):
-                return set(str(x) for x in data)
+                return set(map(str, data))
     except Exception:
         pass
     return set()
@@ -356,7 +429,25 @@ def load_seen() -> set[str]:
 
 def save_seen(seen: set[str]) -> None:
     try:
-        SEEN_FILE.write_text(json.dumps(sorted(seen), indent=2), encoding="utf-8")
+        SEEN_FILE.write_text(json.dumps(list(seen), separators=(",", ":")), encoding="utf-8")
+    except Exception:
+        pass
+
+
+def load_etags() -> Dict[str, Dict[str, Any]]:
+    try:
+        if ETAG_FILE.exists():
+            data = json.loads(ETAG_FILE.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                return data
+    except Exception:
+        pass
+    return {}
+
+
+def save_etags(etags: Dict[str, Dict[str, Any]]) -> None:
+    try:
+        ETAG_FILE.write_text(json.dumps(etags, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
     except Exception:
         pass
 
@@ -365,7 +456,11 @@ def load_cache() -> Optional[Dict[str, Any]]:
     if not CACHE_FILE.exists():
         return None
     try:
-        data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+        # plain data only (never unpickle a file from the working directory);
+        # json.loads decodes the bytes in C without a separate text decode step
+        data = json.loads(CACHE_FILE.read_bytes())
+        if data.get("schema") != [list(ITEM_FIELDS), list(STATUS_FIELDS)]:
+            return None
         age = time.time() - float(data.get("cache_ts", 0))
         if age <= CACHE_TTL_SECONDS:
             return data
@@ -375,103 +470,335 @@ def load_cache() -> Optional[Dict[str, Any]]:
 
 
 def save_cache(items: List[Item], statuses: List[FeedStatus]) -> None:
+    # positional rows (key names stored once in "schema"), compact separators;
+    # a cache hit is one C-level json.loads + Item(*row)
     payload = {
         "cache_ts": time.time(),
         "fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "items": [it.__dict__ for it in items],
-        "statuses": [st.__dict__ for st in statuses],
+        "schema": (ITEM_FIELDS, STATUS_FIELDS),
+        "items": [_item_row(it) for it in items],
+        "statuses": [_status_row(st) for st in statuses],
     }
-    CACHE_FILE.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    CACHE_FILE.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
 
 
 def clear_cache() -> None:
-    try:
-        if CACHE_FILE.exists():
-            CACHE_FILE.unlink()
-    except Exception:
-        pass
+    for path in (CACHE_FILE, ETAG_FILE):
+        try:
+            if path.exists():
+                path.unlink()
+        except Exception:
+            pass
 
 
 # =============================================================================
-# FETCH
+# HTTP (keep-alive pool, stdlib only)
 # =============================================================================
 
-def fetch_all(force_refresh: bool) -> Tuple[List[Item], List[FeedStatus], str]:
-    if not force_refresh:
-        cached = load_cache()
-        if cached:
-            items = [Item(**d) for d in cached.get("items", [])]
-            statuses = [FeedStatus(**d) for d in cached.get("statuses", [])]
-            return items, statuses, "cache"
+HTTP_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
+    "Accept-Encoding": "gzip, deflate",
+    "Cache-Control": "no-cache",
+}
 
-    seen = load_seen()
-    items: List[Item] = []
-    statuses: List[FeedStatus] = []
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+class HTTPPool:
+    """
+    Minimal keep-alive connection pool over http.client:
+    - idle connections are parked per (scheme, host) and reused across feeds
+      and refreshes, so repeat hosts skip the TCP + TLS handshake
+    - thread-safe checkout/checkin (fetch workers share one pool)
+    - follows redirects, decodes gzip/deflate bodies
+    """
+    def __init__(self, max_idle_per_host: int = HTTP_POOL_MAX_IDLE_PER_HOST):
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._max_idle = max_idle_per_host
+        self._ssl = ssl.create_default_context()
 
-    for f in FEEDS:
-        cat = f["cat"]
-        name = f["name"]
-        urls: List[str] = f.get("urls", [])
-        used_url = ""
-        last_err = ""
-        count = 0
+    def close(self) -> None:
+        with self._lock:
+            conns = [c for lst in self._idle.values() for c in lst]
+            self._idle.clear()
+        for c in conns:
+            c.close()
+
+    def request(self, url: str, headers: Dict[str, str]) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """GET url -> (status, headers, decoded body). Redirects are followed."""
+        for _ in range(HTTP_MAX_REDIRECTS + 1):
+            parts = urllib.parse.urlsplit(url)
+            key = (parts.scheme.lower(), parts.netloc)
+            path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+            status, hdrs, body = self._roundtrip(key, path, headers)
+            location = hdrs.get("Location", "")
+            if status in _REDIRECT_CODES and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
 
-        for u in urls:
+            enc = (hdrs.get("Content-Encoding") or "").strip().lower()
+            if enc == "gzip":
+                body = gzip.decompress(body)
+            elif enc == "deflate":
+                try:
+                    body = zlib.decompress(body)
+                except zlib.error:
+                    body = zlib.decompress(body, -zlib.MAX_WBITS)   # raw deflate
+            return status, hdrs, body
+
+        raise urllib.error.HTTPError(url, status, "Too many redirects", hdrs, None)
+
+    # ---------------- internals ----------------
+
+    def _checkout(self, key: Tuple[str, str], fresh: bool) -> Tuple[http.client.HTTPConnection, bool]:
+        if not fresh:
+            with self._lock:
+                idle = self._idle.get(key)
+                if idle:
+                    return idle.pop(), True
+
+        scheme, host = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, timeout=HTTP_TIMEOUT_SECONDS, context=self._ssl), False
+        if scheme == "http":
+            return http.client.HTTPConnection(host, timeout=HTTP_TIMEOUT_SECONDS), False
+        raise ValueError(f"unsupported URL scheme: {scheme!r}")
+
+    def _checkin(self, key: Tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _roundtrip(
+        self, key: Tuple[str, str], path: str, headers: Dict[str, str], fresh: bool = False
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        conn, reused = self._checkout(key, fresh)
+        try:
+            conn.request("GET", path, headers=headers)
+            r = conn.getresponse()
+            body = r.read()
+        except TimeoutError:
+            conn.close()
+            raise
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+            # server dropped the idle keep-alive socket; retry once on a new one
+            return self._roundtrip(key, path, headers, fresh=True)
+
+        if r.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return r.status, r.headers, body
+
+
+class NotModified(Exception):
+    """Conditional GET answered 304: the copy we already have is current."""
+
+
+_HTTP = HTTPPool()
+_PROXIES = urllib.request.getproxies()
+
+_host_sems: Dict[str, threading.Semaphore] = {}
+_host_sems_lock = threading.Lock()
+
+
+def _host_semaphore(url: str) -> threading.Semaphore:
+    """Per-host gate: feeds sharing an origin (CBC, BBC, BoC, arXiv...) don't pile onto it at once."""
+    host = _domain_from_url(url)
+    with _host_sems_lock:
+        sem = _host_sems.get(host)
+        if sem is None:
+            sem = _host_sems[host] = threading.Semaphore(HTTP_MAX_PER_HOST)
+        return sem
+
+
+def http_fetch(
+    url: str, etag: str = "", last_modified: str = "", pool: Optional[HTTPPool] = None
+) -> Tuple[bytes, str, str]:
+    """
+    GET url -> (body, etag, last_modified) over `pool` (default: module pool).
+    Sends If-None-Match / If-Modified-Since when validators are given and
+    raises NotModified on a 304.
+    """
+    headers = dict(HTTP_HEADERS)
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    # proxied setups keep going through urllib (it honours system proxy config)
+    if _PROXIES.get(urllib.parse.urlsplit(url).scheme.lower()):
+        del headers["Accept-Encoding"]
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as r:
+                return r.read(), r.headers.get("ETag", ""), r.headers.get("Last-Modified", "")
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                raise NotModified(url) from None
+            raise
+
+    status, hdrs, body = (pool or _HTTP).request(url, headers)
+    if status == 304:
+        raise NotModified(url)
+    if not 200 <= status < 300:
+        raise urllib.error.HTTPError(url, status, http.client.responses.get(status, ""), hdrs, None)
+    return body, hdrs.get("ETag", ""), hdrs.get("Last-Modified", "")
+
+
+def http_get(url: str) -> bytes:
+    return http_fetch(url)[0]
+
+
+# =============================================================================
+# FETCH
+# =============================================================================
+
+def _fetch_one(
+    f: Dict[str, Any], seen: frozenset[str], etags: Dict[str, Dict[str, Any]], http: Optional[HTTPPool]
+) -> Tuple[List[Item], FeedStatus, Dict[str, Dict[str, Any]]]:
+    """
+    Fetch + parse a single feed (runs on a pool worker).
+    `seen` and `etags` are read-only here; fetch_all merges the new ids and
+    the returned validator entries after the join.
+    """
+    cat = f["cat"]
+    name = f["name"]
+    src_code = SRC_CODE.get(name, name[:6].upper())   # per-feed constant, not per item
+    urls: List[str] = f.get("urls", [])
+    items: List[Item] = []
+    etag_updates: Dict[str, Dict[str, Any]] = {}
+    used_url = ""
+    last_err = ""
+    count = 0
+
+    for u in urls:
+        if _FETCH_ABORT.is_set():
+            break       # app closing: don't start a fallback URL
+        try:
+            prev = etags.get(u) or {}
             try:
-                raw = http_get(u)
+                with _host_semaphore(u):
+                    if _FETCH_ABORT.is_set():
+                        break   # waited on the host limit while the app closed
+                    raw, etag, last_modified = http_fetch(
+                        u, prev.get("etag", ""), prev.get("last_modified", ""), pool=http
+                    )
                 parsed = parse_feed_best_effort(raw)
+                if etag or last_modified:
+                    etag_updates[u] = {"etag": etag, "last_modified": last_modified, "parsed": parsed}
+            except NotModified:
+                # 304: nothing on the wire, nothing to parse
+                parsed = prev.get("parsed") or []
+                etag_updates[u] = prev
+
+            for p in parsed:
+                title = _clean(p.get("title", ""), 260)
+                summary = _clean(p.get("summary", ""), SUMMARY_CHARS_DETAIL)
+                url = (p.get("url", "") or "").strip()
+
+                fallback_id = f"{name}|{title[:200]}|{p.get('date','')[:50]}"
+                item_id = url if url else fallback_id
+
+                epoch = _parse_date_any(p.get("date", ""))
+                domain = _domain_from_url(url)
+                is_new = item_id not in seen
+
+                items.append(Item(
+                    id=item_id,
+                    epoch=epoch,
+                    ts=_fmt_hhmm(epoch),
+                    cat=cat,
+                    src=name,
+                    src_code=src_code,
+                    title=title or "(no title)",
+                    summary=summary,
+                    url=url,
+                    domain=domain,
+                    is_new=is_new,
+                ))
+                count += 1
+
+            used_url = u
+            last_err = ""
+            break
 
-                for p in parsed:
-                    title_raw = html_unescape(_strip_html(p.get("title", "")))
-                    summary_raw = html_unescape(_strip_html(p.get("summary", "")))
-                    url = (p.get("url", "") or "").strip()
-
-                    fallback_id = f"{name}|{title_raw[:200]}|{p.get('date','')[:50]}"
-                    item_id = url if url else fallback_id
-
-                    epoch = _parse_date_any(p.get("date", ""))
-                    domain = _domain_from_url(url)
-                    is_new = item_id not in seen
-
-                    items.append(Item(
-                        id=item_id,
-                        epoch=epoch,
-                        ts=_fmt_hhmm(epoch),
-                        cat=cat,
-                        src=name,
-                        src_code=SRC_CODE.get(name, name[:6].upper()),
-                        title=_truncate(title_raw, 260) or "(no title)",
-                        summary=_truncate(summary_raw, SUMMARY_CHARS_DETAIL),
-                        url=url,
-                        domain=domain,
-                        is_new=is_new,
-                    ))
-                    count += 1
-
-                used_url = u
-                last_err = ""
-                break
+        except Exception as e:
+            last_err = f"{type(e).__name__}: {e}"
+            continue
 
-            except Exception as e:
-                last_err = f"{type(e).__name__}: {e}"
-                continue
+    if count > 0 and not last_err:
+        return items, FeedStatus(name=name, cat=cat, status="OK", used_url=used_url, error="", count=count), etag_updates
+    return items, FeedStatus(
+        name=name, cat=cat, status="FAIL",
+        used_url=urls[0] if urls else "", error=last_err, count=0
+    ), etag_updates
 
-        if count > 0 and not last_err:
-            statuses.append(FeedStatus(name=name, cat=cat, status="OK", used_url=used_url, error="", count=count))
-        else:
-            statuses.append(FeedStatus(
-                name=name, cat=cat, status="FAIL",
-                used_url=urls[0] if urls else "", error=last_err, count=0
-            ))
 
-    items.sort(key=lambda x: float(x.epoch or 0.0), reverse=True)
-    items = items[:MAX_ITEMS_TOTAL]
+# Created once and reused by every refresh; threads start lazily on first
+# submit and stay bounded by FETCH_WORKERS however long FEEDS gets.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="rssfeed")
+_FETCH_ABORT = threading.Event()
 
-    for it in items:
-        if it.id:
-            seen.add(it.id)
+
+def abort_fetches() -> None:
+    """
+    Stop refresh work for good (app exit). Pool workers are not daemon
+    threads, so queued feeds are cancelled and only requests already on the
+    wire are waited for; a fetch_all in progress raises instead of saving.
+    """
+    _FETCH_ABORT.set()
+    _FETCH_POOL.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_all(force_refresh: bool, http: Optional[HTTPPool] = None) -> Tuple[List[Item], List[FeedStatus], str]:
+    if not force_refresh:
+        cached = load_cache()
+        if cached:
+            items = [Item(*row) for row in cached.get("items", [])]
+            statuses = [FeedStatus(*row) for row in cached.get("statuses", [])]
+            return items, statuses, "cache"
+
+    seen = load_seen()
+    seen_snapshot = frozenset(seen)
+    etags = load_etags()
+    new_etags: Dict[str, Dict[str, Any]] = {}
+    parts: Dict[int, List[Item]] = {}
+    results: Dict[int, FeedStatus] = {}
+
+    # network-bound: feeds run on the shared pool, results merged as they complete
+    futures = {_FETCH_POOL.submit(_fetch_one, f, seen_snapshot, etags, http): i for i, f in enumerate(FEEDS)}
+    for fut in as_completed(futures):
+        if _FETCH_ABORT.is_set():
+            raise RuntimeError("fetch aborted")     # partial round: keep seen/etags/cache as they were
+        items_part, st, etag_part = fut.result()
+        new_etags.update(etag_part)
+        parts[futures[fut]] = items_part
+        results[futures[fut]] = st
+
+    # reassemble in FEEDS order, not completion order: nlargest keeps ties
+    # (undated items, batch-stamped feeds) in input order
+    statuses = [results[i] for i in range(len(FEEDS))]
+    items: List[Item] = [it for i in range(len(FEEDS)) for it in parts[i]]
+
+    # newest MAX_ITEMS_TOTAL, newest first: O(N log K) instead of a full sort
+    items = heapq.nlargest(MAX_ITEMS_TOTAL, items, key=operator.attrgetter("epoch"))
+
+    # workers only read the snapshot; merge the new ids in one C-level pass
+    seen.update(it.id for it in items if it.id)
     save_seen(seen)
 
+    # only URLs that answered this round are kept, so removed feeds age out
+    save_etags(new_etags)
     save_cache(items, statuses)
     return items, statuses, "live"
 
@@ -480,24 +807,48 @@ def fetch_all(force_refresh: bool) -> Tuple[List[Item], List[FeedStatus], str]:
 # TTS (Windows built-in, no pip deps)
 # =============================================================================
 
+# Long-lived PowerShell host: loads System.Speech once, then reads one
+# UTF-8 command per stdin line (read via its own StreamReader, so the
+# console code page doesn't matter):
+#   S:<text>   queue an utterance (SpeakAsync plays them in order)
+#   X          cancel current + queued speech
+_TTS_HOST_PS = (
+    "Add-Type -AssemblyName System.Speech;"
+    "$s=New-Object System.Speech.Synthesis.SpeechSynthesizer;"
+    "$s.Rate=0;"
+    "$s.Volume=100;"
+    "$r=New-Object IO.StreamReader([Console]::OpenStandardInput(),(New-Object Text.UTF8Encoding($false)));"
+    "while(($l=$r.ReadLine()) -ne $null){"
+    "if($l -eq 'X'){$s.SpeakAsyncCancelAll();continue};"
+    "if($l.StartsWith('S:')){[void]$s.SpeakAsync($l.Substring(2))}"
+    "}"
+)
+
+# SpVoice.Speak flags
+SVSF_ASYNC = 1
+SVSF_PURGE_BEFORE_SPEAK = 2
+SVSF_IS_NOT_XML = 16
+
+
 class WindowsTTSWorker:
     """
     Non-blocking TTS worker:
     - UI thread only enqueues text
-    - Worker thread runs PowerShell and waits there (UI stays responsive)
-    - stop() kills current speech immediately
+    - Worker thread speaks in-process through SAPI when pywin32 happens to
+      be installed (optional), otherwise through one long-lived PowerShell
+      host it pipes each utterance to (no per-utterance process start-up)
+    - stop() cancels current + queued speech immediately
     """
     def __init__(self):
         self._q: "queue.Queue[tuple[str, Optional[str]]]" = queue.Queue()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._proc: Optional[subprocess.Popen] = None
-        self._lock = threading.Lock()
+        self._voice: Any = None     # SAPI.SpVoice, created on the worker thread
         self._alive = True
         self._thread.start()
 
     def shutdown(self) -> None:
         self._alive = False
-        self.stop()
         try:
             self._q.put_nowait(("__quit__", None))
         except Exception:
@@ -514,10 +865,69 @@ class WindowsTTSWorker:
 
     # ---------------- internals ----------------
 
-    def _kill_proc(self) -> None:
-        with self._lock:
-            p = self._proc
+    def _open_sapi(self) -> Any:
+        # optional: pywin32 is not required, the PowerShell host covers its absence
+        try:
+            import pythoncom
+            import win32com.client
+            pythoncom.CoInitialize()
+            return win32com.client.Dispatch("SAPI.SpVoice")
+        except Exception:
+            return None
+
+    def _speak(self, text: str) -> None:
+        if self._voice is not None:
+            try:
+                self._voice.Speak(text, SVSF_ASYNC | SVSF_IS_NOT_XML)
+                return
+            except Exception:
+                self._voice = None      # fall back to the PowerShell host
+
+        # line protocol: the text itself, newlines flattened (no Base64 step)
+        self._send("S:" + text.replace("\r", " ").replace("\n", " "))
+
+    def _cancel(self) -> None:
+        if self._voice is not None:
+            try:
+                self._voice.Speak("", SVSF_ASYNC | SVSF_PURGE_BEFORE_SPEAK)
+            except Exception:
+                pass
+        self._send("X", spawn=False)
+
+    def _ensure_host(self) -> Optional[subprocess.Popen]:
+        p = self._proc
+        if p and p.poll() is None:
+            return p
+
+        script = base64.b64encode(_TTS_HOST_PS.encode("utf-16le")).decode("ascii")
+        try:
+            self._proc = subprocess.Popen(
+                ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-EncodedCommand", script],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+        except Exception:
             self._proc = None
+        return self._proc
+
+    def _send(self, line: str, spawn: bool = True) -> None:
+        # one retry: if the host died, start a fresh one and resend
+        for _ in range(2):
+            p = self._ensure_host() if spawn else self._proc
+            if not p or not p.stdin:
+                return
+            try:
+                p.stdin.write((line + "\n").encode("utf-8", errors="ignore"))
+                p.stdin.flush()
+                return
+            except OSError:
+                self._kill_proc()
+
+    def _kill_proc(self) -> None:
+        p = self._proc
+        self._proc = None
 
         if not p or p.poll() is not None:
             return
@@ -535,22 +945,39 @@ class WindowsTTSWorker:
             except Exception:
                 pass
 
+    def _close_host(self) -> None:
+        p = self._proc
+        if not p:
+            return
+        try:
+            if p.stdin:
+                p.stdin.close()     # host loop sees EOF and exits
+            p.wait(timeout=2)
+        except Exception:
+            pass
+        self._kill_proc()
+
     def _run(self) -> None:
+        self._voice = self._open_sapi()
+
         while self._alive:
             cmd, payload = self._q.get()
             if cmd == "__quit__":
                 break
 
             if cmd == "stop":
-                self._kill_proc()
                 # drain queued speech so stop actually stops the pipeline
+                quit_seen = False
                 while True:
                     try:
                         c2, _ = self._q.get_nowait()
                         if c2 == "__quit__":
-                            return
+                            quit_seen = True
                     except queue.Empty:
                         break
+                self._cancel()
+                if quit_seen:
+                    break
                 continue
 
             if cmd != "speak":
@@ -563,35 +990,11 @@ class WindowsTTSWorker:
             if len(text) > 2500:
                 text = text[:2490] + "…"
 
-            b = text.encode("utf-16le", errors="ignore")
-            b64 = base64.b64encode(b).decode("ascii")
+            self._speak(text)
 
-            ps = (
-                "$b=[Convert]::FromBase64String('{b64}');"
-                "$t=[Text.Encoding]::Unicode.GetString($b);"
-                "Add-Type -AssemblyName System.Speech;"
-                "$s=New-Object System.Speech.Synthesis.SpeechSynthesizer;"
-                "$s.Rate=0;"
-                "$s.Volume=100;"
-                "$s.Speak($t);"
-            ).format(b64=b64)
-
-            self._kill_proc()
-
-            try:
-                p = subprocess.Popen(
-                    ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", ps],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    stdin=subprocess.DEVNULL,
-                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-                )
-                with self._lock:
-                    self._proc = p
-                p.wait()
-            except Exception:
-                self._kill_proc()
-                continue
+        self._cancel()
+        self._voice = None
+        self._close_host()
 
 
 # =============================================================================
@@ -613,16 +1016,37 @@ class RSSDOSApp(tk.Tk):
         self.statuses: List[FeedStatus] = []
         self.source_mode: str = "cache"
 
-        self.active_cats = set(CATEGORY_KEYS)
+        self.active_cats: frozenset[str] = frozenset(CATEGORY_KEYS)   # replaced, never mutated
         self.group_by_cat = False
         self.filter_text = ""
+        self._filter_tokens: Tuple[str, ...] = ()   # filter_text split on whitespace; all must match
 
         self.display_rows: List[Dict[str, Any]] = []
+        self._id_to_row_idx: Dict[str, int] = {}   # item id -> index into display_rows
         self._headline_items: List[Item] = []
 
-        self._q: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        # formatted strings per Item object (keyed by id(it): the same story id can
+        # come from two feeds), valid for one load; cleared in _ingest, and
+        # self.items keeps every keyed object alive until then
+        self._chip_text_cache: Dict[int, str] = {}
+        self._speak_text_cache: Dict[Tuple[int, bool], str] = {}
+
+        # --- Incremental filtering (see _rebuild_display) ---
+        self._search_after_id: Optional[str] = None
+        self._last_items: Optional[List[Item]] = None
+        self._last_active_cats: Optional[frozenset[str]] = None
+        self._last_filter_text = ""
+        self._last_filtered: List[Item] = []
+        self._cat_counts: Counter[str] = Counter()      # items per category, set at ingest
+        self._shown_counts: Dict[str, int] = {}         # per-category counts of _last_filtered
+
+        self._pending: Optional["Future[Tuple[List[Item], List[FeedStatus], str]]"] = None
         self._loading = False
 
+        # one reusable fetch thread + one keep-alive pool for the app's lifetime
+        self._exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rssfetch")
+        self._http = HTTPPool()
+
         self.tts = WindowsTTSWorker()
 
         # --- Auto-speak latch (speak only when newest headline changes) ---
@@ -646,6 +1070,9 @@ class RSSDOSApp(tk.Tk):
             self.tts.shutdown()
         except Exception:
             pass
+        self._exec.shutdown(wait=False, cancel_futures=True)
+        abort_fetches()
+        self._http.close()
         self.destroy()
 
     # ---------------- Auto refresh ----------------
@@ -704,6 +1131,27 @@ class RSSDOSApp(tk.Tk):
         self.head_inner.bind("<Configure>", lambda e: self.head_canvas.configure(scrollregion=self.head_canvas.bbox("all")))
         self.head_canvas.bind("<Configure>", self._on_head_canvas_resize)
 
+        # fixed pool of chips, reconfigured in place by _render_headlines
+        self._head_none = tk.Label(
+            self.head_inner, text="(none)", bg=THEME["panel"], fg=THEME["dim"], font=self.f_mono, padx=8, pady=6
+        )
+        self._head_chips: List[tk.Label] = []
+        for _ in range(HEADLINE_COUNT):
+            chip = tk.Label(
+                self.head_inner,
+                bg=THEME["bg"],
+                font=self.f_mono,
+                padx=10,
+                pady=6,
+                bd=1,
+                relief="solid",
+                highlightthickness=0
+            )
+            chip._item_id = ""   # type: ignore[attr-defined]  # set by _render_headlines
+            chip.bind("<Button-1>", self._on_chip_click)
+            chip.bind("<Double-Button-1>", self._on_chip_double_click)
+            self._head_chips.append(chip)
+
         self.topbar = tk.Label(
             self,
             text="",
@@ -747,24 +1195,62 @@ class RSSDOSApp(tk.Tk):
         list_frame = tk.Frame(left, bg=THEME["bg"])
         list_frame.pack(fill="both", expand=True, padx=10, pady=(6, 10))
 
-        self.lb = tk.Listbox(
-            list_frame,
-            bg=THEME["bg"],
-            fg=THEME["fg"],
+        # Treeview instead of Listbox: only visible rows are drawn, and row
+        # colours come from per-category tags configured once (no per-row itemconfig)
+        style = ttk.Style(self)
+        style.theme_use("clam")   # honours background colours on every platform
+        style.configure(
+            "Scan.Treeview",
+            background=THEME["bg"],
+            fieldbackground=THEME["bg"],
+            foreground=THEME["fg"],
             font=self.f_mono,
-            selectbackground=THEME["select_bg"],
-            selectforeground=THEME["select_fg"],
-            activestyle="none",
-            highlightthickness=0,
-            relief="flat"
+            rowheight=self.f_mono.metrics("linespace") + 2,
+            indent=0,
+            borderwidth=0,
         )
+        style.map(
+            "Scan.Treeview",
+            background=[("selected", THEME["select_bg"])],
+            foreground=[("selected", THEME["select_fg"])],
+        )
+        style.layout("Scan.Treeview", [("Treeview.treearea", {"sticky": "nswe"})])
+
+        # feed status window (headings shown)
+        style.configure(
+            "Status.Treeview",
+            background=THEME["bg"],
+            fieldbackground=THEME["bg"],
+            foreground=THEME["fg"],
+            font=self.f_mono,
+            rowheight=self.f_mono.metrics("linespace") + 2,
+            borderwidth=0,
+        )
+        style.configure(
+            "Status.Treeview.Heading",
+            background=THEME["panel"],
+            foreground=THEME["cyan"],
+            font=self.f_mono,
+            relief="flat",
+        )
+        style.map(
+            "Status.Treeview",
+            background=[("selected", THEME["select_bg"])],
+            foreground=[("selected", THEME["select_fg"])],
+        )
+
+        self.lb = ttk.Treeview(list_frame, style="Scan.Treeview", show="tree", selectmode="browse")
         self.lb.pack(side="left", fill="both", expand=True)
 
+        for cat, color in CAT_COLOR.items():
+            self.lb.tag_configure(cat, foreground=color)
+        self.lb.tag_configure("header", foreground=THEME["magenta"])
+
         sb = tk.Scrollbar(list_frame, command=self.lb.yview)
         sb.pack(side="right", fill="y")
         self.lb.configure(yscrollcommand=sb.set)
 
-        self.lb.bind("<<ListboxSelect>>", lambda e: self._on_select())
+        self.lb.bind("<<TreeviewSelect>>", lambda e: self._on_select())
         self.lb.bind("<Double-Button-1>", lambda e: self._open_selected())
 
         right = tk.Frame(pw, bg=THEME["bg"])
@@ -808,110 +1294,119 @@ class RSSDOSApp(tk.Tk):
         self.footer.pack(fill="x")
 
     def _bind_keys(self):
-        self.bind("<KeyPress-r>", lambda e: self._load(force_refresh=True))
-        self.bind("<KeyPress-R>", lambda e: self._load(force_refresh=True))
-
-        self.bind("<KeyPress-c>", lambda e: self._clear_cache_and_reload())
-        self.bind("<KeyPress-C>", lambda e: self._clear_cache_and_reload())
-
-        self.bind("<KeyPress-a>", lambda e: self._toggle_all())
-        self.bind("<KeyPress-A>", lambda e: self._toggle_all())
-
-        self.bind("<KeyPress-f>", lambda e: self._show_feed_status())
-        self.bind("<KeyPress-F>", lambda e: self._show_feed_status())
-
-        self.bind("<KeyPress-g>", lambda e: self._toggle_group())
-        self.bind("<KeyPress-G>", lambda e: self._toggle_group())
-
-        # TTS
-        self.bind("<KeyPress-s>", lambda e: self._tts_speak_selected())
-        self.bind("<KeyPress-S>", lambda e: self._tts_speak_selected())
-        self.bind("<KeyPress-x>", lambda e: self._tts_stop())
-        self.bind("<KeyPress-X>", lambda e: self._tts_stop())
-        self.bind("<KeyPress-h>", lambda e: self._tts_speak_headline())
-        self.bind("<KeyPress-H>", lambda e: self._tts_speak_headline())
-
+        self.bind("<<FetchDone>>", lambda e: self._finish_load())
+
+        # one <KeyPress> binding; keysyms are lower-cased so each letter
+        # covers both cases, like the old per-case <KeyPress-x> pairs
+        self._key_actions: Dict[str, Callable[[], None]] = {
+            "r": lambda: self._load(force_refresh=True),
+            "c": self._clear_cache_and_reload,
+            "a": self._toggle_all,
+            "f": self._show_feed_status,
+            "g": self._toggle_group,
+            # TTS
+            "s": self._tts_speak_selected,
+            "x": self._tts_stop,
+            "h": self._tts_speak_headline,
+        }
         for i, cat in enumerate(CATEGORY_KEYS, start=1):
-            self.bind(f"<KeyPress-{i}>", lambda e, c=cat: self._toggle_cat(c))
+            self._key_actions[str(i)] = functools.partial(self._toggle_cat, cat)
+        self.bind("<KeyPress>", self._on_key)
 
         self.bind("<Return>", lambda e: self._open_selected())
 
+    def _on_key(self, event):
+        action = self._key_actions.get(event.keysym.lower())
+        if action:
+            action()
+
     # ---------------- Headlines ribbon ----------------
 
     def _on_head_canvas_resize(self, event):
         self.head_canvas.itemconfigure(self.head_window, height=event.height)
 
     def _render_headlines(self):
-        for child in list(self.head_inner.winfo_children()):
-            child.destroy()
+        # _last_filtered is this rebuild's filter result, newest-first (sorted at
+        # ingest), so the first HEADLINE_COUNT matches are the newest ones
+        heads: List[Item] = []
+        for it in self._last_filtered:
+            if it.cat in HEADLINE_CATS:
+                heads.append(it)
+                if len(heads) >= HEADLINE_COUNT:
+                    break
+        self._headline_items = heads
+
+        n = len(self._headline_items)
+        if n:
+            self._head_none.pack_forget()
+        elif not self._head_none.winfo_manager():
+            self._head_none.pack(side="left")
+
+        # only a suffix is ever unpacked, so re-packing in index order keeps chip order
+        for i, chip in enumerate(self._head_chips):
+            if i >= n:
+                chip._item_id = ""   # type: ignore[attr-defined]
+                chip.pack_forget()
+                continue
 
-        candidates = [
-            it for it in self.items
-            if it.cat in HEADLINE_CATS and self._passes_filters(it)
-        ]
-        candidates.sort(key=lambda x: float(x.epoch or 0.0), reverse=True)
-        self._headline_items = candidates[:HEADLINE_COUNT]
+            it = self._headline_items[i]
+            key = id(it)
+            text = self._chip_text_cache.get(key)
+            if text is None:
+                cat3 = it.cat[:3]
+                new = " NEW" if it.is_new else ""
+                text = f"{it.ts} [{cat3}] {it.src_code}: {_truncate(it.title, HEADLINE_TITLE_CHARS)}{new}"
+                self._chip_text_cache[key] = text
 
-        if not self._headline_items:
-            tk.Label(
-                self.head_inner, text="(none)", bg=THEME["panel"], fg=THEME["dim"], font=self.f_mono, padx=8, pady=6
-            ).pack(side="left")
-            return
+            chip._item_id = it.id   # type: ignore[attr-defined]
+            chip.configure(text=text, fg=CAT_COLOR.get(it.cat, THEME["fg"]))
+            if not chip.winfo_manager():
+                chip.pack(side="left", padx=6, pady=6)
 
-        for i, it in enumerate(self._headline_items):
-            cat3 = it.cat[:3]
-            new = " NEW" if it.is_new else ""
-            text = f"{it.ts} [{cat3}] {it.src_code}: {_truncate(it.title, HEADLINE_TITLE_CHARS)}{new}"
+    # shared by every pooled chip; the chip carries the id of the item it shows
 
-            fg = CAT_COLOR.get(it.cat, THEME["fg"])
-            chip = tk.Label(
-                self.head_inner,
-                text=text,
-                bg=THEME["bg"],
-                fg=fg,
-                font=self.f_mono,
-                padx=10,
-                pady=6,
-                bd=1,
-                relief="solid",
-                highlightthickness=0
-            )
-            chip.pack(side="left", padx=6, pady=6)
+    def _on_chip_click(self, event):
+        item_id = getattr(event.widget, "_item_id", "")
+        if item_id:
+            self._select_item_by_id(item_id)
 
-            chip.bind("<Button-1>", lambda e, item_id=it.id: self._select_item_by_id(item_id))
-            chip.bind("<Double-Button-1>", lambda e, item_id=it.id: self._open_item_by_id(item_id))
+    def _on_chip_double_click(self, event):
+        item_id = getattr(event.widget, "_item_id", "")
+        if item_id:
+            self._open_item_by_id(item_id)
 
     def _select_item_by_id(self, item_id: str):
-        for idx, row in enumerate(self.display_rows):
-            if row.get("type") == "item" and row["item"].id == item_id:
-                self.lb.selection_clear(0, tk.END)
-                self.lb.selection_set(idx)
-                self.lb.activate(idx)
-                self.lb.see(idx)
-                self._render_detail_from_row_index(idx)
-                return
+        idx = self._id_to_row_idx.get(item_id)
+        if idx is None:
+            return
+        self._select_row(idx)
 
     def _open_item_by_id(self, item_id: str):
-        for row in self.display_rows:
-            if row.get("type") == "item" and row["item"].id == item_id:
-                if row["item"].url:
-                    webbrowser.open(row["item"].url)
-                return
+        idx = self._id_to_row_idx.get(item_id)
+        if idx is None:
+            return
+        url = self.display_rows[idx]["item"].url
+        if url:
+            webbrowser.open(url)
 
     # ---------------- State changes ----------------
 
     def _toggle_cat(self, cat: str):
-        if cat in self.active_cats:
-            self.active_cats.remove(cat)
-        else:
-            self.active_cats.add(cat)
+        toggled = self.active_cats ^ {cat}
+        # a category with no items can't change the rows, unless the set goes
+        # from or to empty (empty means "everything")
+        if not self._cat_counts[cat] and self.active_cats and toggled:
+            self.active_cats = self._last_active_cats = toggled
+            self._update_topbar()
+            return
+        self.active_cats = toggled
         self._rebuild_display()
 
     def _toggle_all(self):
         if self.active_cats:
-            self.active_cats.clear()
+            self.active_cats = frozenset()
         else:
-            self.active_cats = set(CATEGORY_KEYS)
+            self.active_cats = frozenset(CATEGORY_KEYS)
         self._rebuild_display()
 
     def _toggle_group(self):
@@ -919,7 +1414,15 @@ class RSSDOSApp(tk.Tk):
         self._rebuild_display()
 
     def _on_search_change(self):
+        # debounce: fast typing coalesces into one rebuild
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._apply_search)
+
+    def _apply_search(self):
+        self._search_after_id = None
         self.filter_text = (self.search_var.get() or "").strip().lower()
+        self._filter_tokens = tuple(self.filter_text.split())
         self._rebuild_display()
 
     def _clear_cache_and_reload(self):
@@ -933,35 +1436,42 @@ class RSSDOSApp(tk.Tk):
             return
         self._loading = True
         self.footer.config(text="> LOADING…")
-        self._set_detail_loading()
-        self.lb.delete(0, tk.END)
+        # the current list stays up while refreshing; an unchanged result keeps it as is
+        if not self.items:
+            self._set_detail_loading()
 
-        t = threading.Thread(target=self._worker_fetch, args=(force_refresh,), daemon=True)
-        t.start()
-        self.after(60, self._poll_queue)
+        self._pending = self._exec.submit(fetch_all, force_refresh=force_refresh, http=self._http)
+        self._pending.add_done_callback(self._on_fetch_done)
 
-    def _worker_fetch(self, force_refresh: bool):
+    def _on_fetch_done(self, fut: Future):
+        # runs on the fetch thread: wake the Tk loop once (virtual events may
+        # be posted from other threads); no idle polling while a fetch is in flight
         try:
-            items, statuses, source = fetch_all(force_refresh=force_refresh)
-            self._q.put(("ok", (items, statuses, source)))
-        except Exception as e:
-            self._q.put(("err", e))
+            self.event_generate("<<FetchDone>>", when="tail")
+        except Exception:
+            pass    # window already closed
 
-    def _poll_queue(self):
-        try:
-            kind, payload = self._q.get_nowait()
-        except queue.Empty:
-            self.after(60, self._poll_queue)
+    def _finish_load(self):
+        fut, self._pending = self._pending, None
+        if fut is None or not fut.done():
             return
 
         self._loading = False
 
-        if kind == "err":
-            self.footer.config(text=f"> ERROR · {payload}")
-            self._set_detail_error(str(payload))
+        try:
+            items, statuses, source = fut.result()
+        except Exception as e:
+            self.footer.config(text=f"> ERROR · {e}")
+            self._set_detail_error(str(e))
+            return
+
+        if self._same_as_shown(items, statuses, source):
+            # typically every feed answered 304: nothing on screen would change
+            self._update_footer()
+            self._on_select()   # no-op unless an earlier error replaced the detail
             return
 
-        items, statuses, source = payload
+        self._ingest(items)
         self.items = items
         self.statuses = statuses
         self.source_mode = source
@@ -971,36 +1481,65 @@ class RSSDOSApp(tk.Tk):
         # --- Auto-speak newest headline ONLY when it changes ---
         self._auto_speak_newest_headline_if_changed()
 
+    def _same_as_shown(self, items: List[Item], statuses: List[FeedStatus], source: str) -> bool:
+        # fetch_all returns a deterministic newest-first order, the one _ingest keeps.
+        # Dataclass equality covers every model field (derived ones are compare=False),
+        # including is_new, which flips on the refresh after an item arrives
+        return bool(self.items) and source == self.source_mode and statuses == self.statuses and items == self.items
+
+    def _ingest(self, items: List[Item]):
+        # per-item work done once per load, not once per keystroke;
+        # newest-first order is fixed here so rebuilds never re-sort
+        items.sort(key=operator.attrgetter("epoch"), reverse=True)
+        self._chip_text_cache.clear()
+        self._speak_text_cache.clear()
+        self._cat_counts = Counter(it.cat for it in items)
+        for it in items:
+            # shared, interned strings: category tests become identity hits
+            it.cat = sys.intern(it.cat)
+            it.src_code = sys.intern(it.src_code)
+            it._search_blob = f"{it.title} {it.summary} {it.src} {it.domain}".lower()
+            new = "*" if it.is_new else " "
+            it._list_line = f"{it.ts:>5}{new} [{it.cat[:3]}] {it.src_code[:6].ljust(6)} {_truncate(it.title, TITLE_CHARS_LIST)}"
+
     # ---------------- Display build ----------------
 
     def _passes_filters(self, it: Item) -> bool:
+        # cheap set lookup first; string work only for items that survive it
         if self.active_cats and it.cat not in self.active_cats:
             return False
-        if not self.filter_text:
-            return True
-        blob = f"{it.title} {it.summary} {it.src} {it.domain}".lower()
-        return self.filter_text in blob
+        blob = it._search_blob
+        for t in self._filter_tokens:
+            if t not in blob:
+                return False
+        return True
 
     def _rebuild_display(self):
-        filtered = [it for it in self.items if self._passes_filters(it)]
+        # Extending the filter text can only drop rows, so when nothing else
+        # changed refilter the previous result instead of every item.
+        if (
+            self._last_items is self.items
+            and self.active_cats == self._last_active_cats
+            and self.filter_text.startswith(self._last_filter_text)
+        ):
+            base = self._last_filtered
+        else:
+            base = self.items
+        filtered = [it for it in base if self._passes_filters(it)]
+
+        self._last_items = self.items
+        self._last_active_cats = self.active_cats
+        self._last_filter_text = self.filter_text
+        self._last_filtered = filtered
 
         counts: Dict[str, int] = {c: 0 for c in CATEGORY_KEYS}
         for it in filtered:
             if it.cat in counts:
                 counts[it.cat] += 1
+        self._shown_counts = counts
 
-        active = [c for c in CATEGORY_KEYS if c in self.active_cats] if self.active_cats else []
-        active_str = ",".join(active) if active else "(none)"
-        counts_str = " | ".join([f"{c[:3]} {counts.get(c,0)}" for c in CATEGORY_KEYS])
-        group_str = "GROUP:CAT" if self.group_by_cat else "GROUP:TIME"
-        filt_str = f"FILTER:'{self.filter_text}'" if self.filter_text else "FILTER:(none)"
-        self.topbar.config(text=f"{group_str} · {filt_str} · ACTIVE:{active_str} · {counts_str}")
-
-        ok = sum(1 for s in self.statuses if s.status == "OK")
-        fail = sum(1 for s in self.statuses if s.status == "FAIL")
-        self.footer.config(
-            text=f"> OK · {len(filtered)}/{len(self.items)} items · {self.source_mode} · ok {ok}/{len(self.statuses)} · fail {fail} · (S speak, X stop)"
-        )
+        self._update_topbar()
+        self._update_footer()
 
         rows: List[Dict[str, Any]] = []
         if self.group_by_cat:
@@ -1011,7 +1550,6 @@ class RSSDOSApp(tk.Tk):
                 grp = by_cat.get(cat, [])
                 if not grp:
                     continue
-                grp.sort(key=lambda x: float(x.epoch or 0.0), reverse=True)
                 rows.append({"type": "header", "cat": cat, "count": len(grp)})
                 for it in grp:
                     rows.append({"type": "item", "item": it})
@@ -1020,56 +1558,82 @@ class RSSDOSApp(tk.Tk):
                 rows.append({"type": "item", "item": it})
 
         self.display_rows = rows
+        # the same story can arrive from two feeds; first row wins, as the old scan did
+        id_to_idx: Dict[str, int] = {}
+        for i, row in enumerate(rows):
+            if row["type"] == "item":
+                id_to_idx.setdefault(row["item"].id, i)
+        self._id_to_row_idx = id_to_idx
         self._render_list()
-        self._render_headlines()
+        # with only non-headline categories active the ribbon is empty whatever
+        # the filter says; once it shows "(none)" there is nothing to redo
+        if not (
+            self.active_cats
+            and self.active_cats.isdisjoint(HEADLINE_CATS)
+            and self._head_none.winfo_manager()
+        ):
+            self._render_headlines()
         self._select_first_item()
 
+    def _update_topbar(self):
+        counts = self._shown_counts
+        active = [c for c in CATEGORY_KEYS if c in self.active_cats] if self.active_cats else []
+        active_str = ",".join(active) if active else "(none)"
+        counts_str = " | ".join([f"{c[:3]} {counts.get(c,0)}" for c in CATEGORY_KEYS])
+        group_str = "GROUP:CAT" if self.group_by_cat else "GROUP:TIME"
+        filt_str = f"FILTER:'{self.filter_text}'" if self.filter_text else "FILTER:(none)"
+        self.topbar.config(text=f"{group_str} · {filt_str} · ACTIVE:{active_str} · {counts_str}")
+
+    def _update_footer(self):
+        ok = sum(1 for s in self.statuses if s.status == "OK")
+        fail = sum(1 for s in self.statuses if s.status == "FAIL")
+        self.footer.config(
+            text=f"> OK · {len(self._last_filtered)}/{len(self.items)} items · {self.source_mode} · ok {ok}/{len(self.statuses)} · fail {fail} · (S speak, X stop)"
+        )
+
     def _render_list(self):
-        self.lb.delete(0, tk.END)
+        # row iid == index into self.display_rows
+        self.lb.delete(*self.lb.get_children())
 
         for i, row in enumerate(self.display_rows):
             if row["type"] == "header":
                 cat = row["cat"]
                 cnt = row["count"]
                 label = f"=== {cat} ({cnt}) " + "=" * 60
-                self.lb.insert(tk.END, label[:240])
-                try:
-                    self.lb.itemconfig(i, fg=THEME["magenta"])
-                except Exception:
-                    pass
+                self.lb.insert("", "end", iid=str(i), text=label[:240], tags=("header",))
                 continue
 
             it: Item = row["item"]
-            cat3 = it.cat[:3]
-            src = it.src_code[:6].ljust(6)
-            new = "*" if it.is_new else " "
-            line = f"{it.ts:>5}{new} [{cat3}] {src} {_truncate(it.title, TITLE_CHARS_LIST)}"
-            self.lb.insert(tk.END, line)
-
-            color = CAT_COLOR.get(it.cat, THEME["fg"])
-            try:
-                self.lb.itemconfig(i, fg=color)
-            except Exception:
-                pass
+            self.lb.insert("", "end", iid=str(i), text=it._list_line, tags=(it.cat,))
 
     def _select_first_item(self):
         for idx, row in enumerate(self.display_rows):
             if row["type"] == "item":
-                self.lb.selection_clear(0, tk.END)
-                self.lb.selection_set(idx)
-                self.lb.activate(idx)
-                self.lb.see(idx)
-                self._render_detail_from_row_index(idx)
+                self._select_row(idx)
                 return
         self._set_detail_empty()
 
     # ---------------- Selection + detail ----------------
 
-    def _on_select(self):
-        sel = self.lb.curselection()
+    def _select_row(self, idx: int):
+        # Treeview fires <<TreeviewSelect>> for programmatic selection too,
+        # so _on_select does the detail render for every caller
+        iid = str(idx)
+        self.lb.selection_set(iid)
+        self.lb.focus(iid)
+        self.lb.see(iid)
+
+    def _selected_row_index(self) -> Optional[int]:
+        sel = self.lb.selection()
         if not sel:
+            return None
+        return int(sel[0])
+
+    def _on_select(self):
+        idx = self._selected_row_index()
+        if idx is None:
             return
-        self._render_detail_from_row_index(int(sel[0]))
+        self._render_detail_from_row_index(idx)
 
     def _render_detail_from_row_index(self, idx: int):
         if idx < 0 or idx >= len(self.display_rows):
@@ -1079,50 +1643,51 @@ class RSSDOSApp(tk.Tk):
         if row["type"] == "header":
             for j in range(idx + 1, len(self.display_rows)):
                 if self.display_rows[j]["type"] == "item":
-                    self.lb.selection_clear(0, tk.END)
-                    self.lb.selection_set(j)
-                    self.lb.activate(j)
-                    self.lb.see(j)
-                    self._render_detail_from_row_index(j)
+                    self._select_row(j)
                     return
             self._set_detail_empty()
             return
 
         it: Item = row["item"]
-
-        self.detail.configure(state="normal")
-        self.detail.delete("1.0", tk.END)
-
-        self.detail.insert(tk.END, it.title + "\n", ("h1",))
-
-        new_tag = "new" if it.is_new else "dim"
-        self.detail.insert(tk.END, "NEW  " if it.is_new else "", (new_tag,))
-        self.detail.insert(tk.END, f"[{it.cat}] ", ("cat",))
-        self.detail.insert(tk.END, f"{it.src}  ", ("src",))
-        self.detail.insert(tk.END, f"{it.ts}  ", ("dim",))
-        self.detail.insert(tk.END, f"{it.domain}\n\n" if it.domain else "\n\n", ("dim",))
+        if getattr(self.detail, "_active_item", None) is it:
+            return      # already on screen (e.g. a rebuild that kept the top item)
+
+        chunks: List[Tuple[str, Tuple[str, ...]]] = [
+            (it.title + "\n", ("h1",)),
+            ("NEW  " if it.is_new else "", ("new" if it.is_new else "dim",)),
+            (f"[{it.cat}] ", ("cat",)),
+            (f"{it.src}  ", ("src",)),
+            (f"{it.ts}  ", ("dim",)),
+            (f"{it.domain}\n\n" if it.domain else "\n\n", ("dim",)),
+        ]
 
         if it.summary:
-            self.detail.insert(tk.END, it.summary.strip() + "\n\n", ())
+            chunks.append((it.summary.strip() + "\n\n", ()))
         else:
-            self.detail.insert(tk.END, "(no summary)\n\n", ("dim",))
+            chunks.append(("(no summary)\n\n", ("dim",)))
 
         if it.url:
-            self.detail.insert(tk.END, "OPEN: ", ("dim",))
-            self.detail.insert(tk.END, it.url, ("url",))
-            self.detail.insert(tk.END, "\n", ())
+            chunks += [("OPEN: ", ("dim",)), (it.url, ("url",)), ("\n", ())]
         else:
-            self.detail.insert(tk.END, "(no url)\n", ("warn",))
+            chunks.append(("(no url)\n", ("warn",)))
+
+        # Text.insert takes alternating text/tags pairs: one call, one relayout
+        args: List[Any] = []
+        for text, tags in chunks:
+            args += (text, tags)
+
+        self.detail.configure(state="normal")
+        self.detail.delete("1.0", tk.END)
+        self.detail.insert(tk.END, *args)
 
         self.detail._active_url = it.url   # type: ignore[attr-defined]
         self.detail._active_item = it      # type: ignore[attr-defined]
         self.detail.configure(state="disabled")
 
     def _open_selected(self):
-        sel = self.lb.curselection()
-        if not sel:
+        idx = self._selected_row_index()
+        if idx is None:
             return
-        idx = int(sel[0])
         row = self.display_rows[idx] if 0 <= idx < len(self.display_rows) else None
         if not row or row["type"] != "item":
             return
@@ -1187,10 +1752,14 @@ class RSSDOSApp(tk.Tk):
         self.footer.config(text=self.footer.cget("text") + " · TTS queued (headline)")
 
     def _compose_speak_text(self, it: Item, include_summary: bool) -> str:
-        parts = [f"{it.cat}. {it.src_code}. {it.title}."]
-        if include_summary and it.summary:
-            parts.append(it.summary)
-        return " ".join(parts)
+        key = (id(it), include_summary)
+        text = self._speak_text_cache.get(key)
+        if text is None:
+            parts = [f"{it.cat}. {it.src_code}. {it.title}."]
+            if include_summary and it.summary:
+                parts.append(it.summary)
+            text = self._speak_text_cache[key] = " ".join(parts)
+        return text
 
     # ---------------- Detail helpers ----------------
 
@@ -1198,12 +1767,16 @@ class RSSDOSApp(tk.Tk):
         self.detail.configure(state="normal")
         self.detail.delete("1.0", tk.END)
         self.detail.insert(tk.END, "LOADING…\n", ("dim",))
+        self.detail._active_url = ""      # type: ignore[attr-defined]
+        self.detail._active_item = None   # type: ignore[attr-defined]
         self.detail.configure(state="disabled")
 
     def _set_detail_empty(self):
         self.detail.configure(state="normal")
         self.detail.delete("1.0", tk.END)
         self.detail.insert(tk.END, "(no items)\n", ("dim",))
+        self.detail._active_url = ""      # type: ignore[attr-defined]
+        self.detail._active_item = None   # type: ignore[attr-defined]
         self.detail.configure(state="disabled")
 
     def _set_detail_error(self, msg: str):
@@ -1211,6 +1784,8 @@ class RSSDOSApp(tk.Tk):
         self.detail.delete("1.0", tk.END)
         self.detail.insert(tk.END, "ERROR\n\n", ("warn",))
         self.detail.insert(tk.END, msg + "\n", ("dim",))
+        self.detail._active_url = ""      # type: ignore[attr-defined]
+        self.detail._active_item = None   # type: ignore[attr-defined]
         self.detail.configure(state="disabled")
 
     # ---------------- Feed status window ----------------
@@ -1221,44 +1796,53 @@ class RSSDOSApp(tk.Tk):
         w.geometry("1100x520")
         w.configure(bg=THEME["bg"])
 
-        t = tk.Text(
+        ok = sum(1 for st in self.statuses if st.status == "OK")
+        fail = len(self.statuses) - ok
+        tk.Label(
             w,
+            text=f"Summary: OK {ok}/{len(self.statuses)} · FAIL {fail}/{len(self.statuses)}",
             bg=THEME["bg"],
-            fg=THEME["fg"],
+            fg=THEME["dim"],
             font=self.f_mono,
-            wrap="none",
-            relief="flat",
-            highlightthickness=0,
+            anchor="w",
             padx=12,
-            pady=12
-        )
-        t.pack(fill="both", expand=True)
-
-        t.tag_configure("ok", foreground=THEME["green"])
-        t.tag_configure("fail", foreground=THEME["red"])
-        t.tag_configure("dim", foreground=THEME["dim"])
-        t.tag_configure("cat", foreground=THEME["magenta"])
-        t.tag_configure("src", foreground=THEME["cyan"])
+            pady=8
+        ).pack(side="bottom", fill="x")
+
+        # Treeview only draws visible rows; a Text re-laid out on every insert
+        frame = tk.Frame(w, bg=THEME["bg"])
+        frame.pack(fill="both", expand=True, padx=12, pady=(12, 0))
+
+        columns = {
+            "status": ("STATUS", 70),
+            "cat": ("CAT", 100),
+            "name": ("NAME", 220),
+            "count": ("ITEMS", 60),
+            "url": ("URL", 360),
+            "error": ("ERROR", 280),
+        }
+        tree = ttk.Treeview(frame, style="Status.Treeview", columns=tuple(columns), show="headings", selectmode="browse")
+        for col, (heading, width) in columns.items():
+            tree.heading(col, text=heading, anchor="w")
+            tree.column(col, width=width, minwidth=40, anchor="w", stretch=col in ("url", "error"))
+
+        tree.tag_configure("ok", foreground=THEME["green"])
+        tree.tag_configure("fail", foreground=THEME["red"])
+
+        ysb = tk.Scrollbar(frame, orient="vertical", command=tree.yview)
+        xsb = tk.Scrollbar(frame, orient="horizontal", command=tree.xview)
+        tree.configure(yscrollcommand=ysb.set, xscrollcommand=xsb.set)
+        ysb.pack(side="right", fill="y")
+        xsb.pack(side="bottom", fill="x")
+        tree.pack(side="left", fill="both", expand=True)
 
-        ok = 0
-        fail = 0
         for st in self.statuses:
-            if st.status == "OK":
-                ok += 1
-            else:
-                fail += 1
-
-            t.insert(tk.END, f"{st.status:<4} ", ("ok" if st.status == "OK" else "fail",))
-            t.insert(tk.END, f"[{st.cat}] ", ("cat",))
-            t.insert(tk.END, f"{st.name} ", ("src",))
-            t.insert(tk.END, f"({st.count})\n", ("dim",))
-            t.insert(tk.END, f"     {st.used_url}\n", ("dim",))
-            if st.error:
-                t.insert(tk.END, f"     {st.error}\n", ("fail",))
-            t.insert(tk.END, "\n", ())
-
-        t.insert(tk.END, f"Summary: OK {ok}/{len(self.statuses)} · FAIL {fail}/{len(self.statuses)}\n", ("dim",))
-        t.configure(state="disabled")
+            tree.insert(
+                "",
+                "end",
+                values=(st.status, st.cat, st.name, st.count, st.used_url, st.error or ""),
+                tags=("ok" if st.status == "OK" else "fail",)
+            )
 
 
 # =============================================================================